@@ -1,84 +1,306 @@
 import os
+import random
 import time
+import hashlib
+import json
 import logging
 import http
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from telebot import TeleBot, apihelper
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 PRACTICUM_TOKEN: str = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN: str = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID: str = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD: int = 600
+MAX_RETRY_PERIOD: int = 3600
+ERROR_RETRY_PERIOD: int = 30
+MAX_ERROR_RETRY_PERIOD: int = 1800
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REQUEST_TIMEOUT = (5, 30)
+_HTTP_OK = http.HTTPStatus.OK.value
+_HTTP_NOT_MODIFIED = http.HTTPStatus.NOT_MODIFIED.value
+_ACCEPTED_STATUSES = frozenset((_HTTP_OK, _HTTP_NOT_MODIFIED))
+_HTTP_BAD_REQUEST = http.HTTPStatus.BAD_REQUEST.value
+TELEGRAM_CONNECT_TIMEOUT: int = 10
+TELEGRAM_READ_TIMEOUT: int = 30
+# Лимит Telegram — 4096 символов, оставляем запас.
+MESSAGE_BATCH_LIMIT: int = 4000
+MESSAGE_SEPARATOR = '\n\n'
+SENT_STATUSES_FILE: str = os.getenv(
+    'SENT_STATUSES_FILE', 'sent_statuses.json'
+)
 
 HOMEWORK_VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+_get_verdict = HOMEWORK_VERDICTS.__getitem__
+_format_message = 'Изменился статус проверки работы "{}". {}'.format
+
+# Одна сессия на всё время работы бота: TCP/TLS-соединение с API
+# переиспользуется между запросами, а не открывается заново каждый цикл.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+SESSION.headers.update(HEADERS)
+SESSION.headers['Connection'] = 'keep-alive'
+
+# Ответ API, который не изменился с прошлого запроса.
+UNCHANGED = object()
+# Валидаторы последнего ответа: ETag, Last-Modified и хеш списка работ.
+_response_cache = {}
+_compression_logged = False
+
+# Запрос к API собирается один раз: перед отправкой меняются только
+# from_date в URL и заголовки условного запроса.
+_PREPARED = SESSION.prepare_request(requests.Request('GET', ENDPOINT))
+_SEND_SETTINGS = SESSION.merge_environment_settings(
+    ENDPOINT, {}, None, None, None
+)
+_CONDITIONAL_HEADERS = (
+    ('If-None-Match', 'etag'),
+    ('If-Modified-Since', 'last_modified'),
+)
 
 
 def check_tokens():
     """Проверяет доступность переменных окружения."""
-    missing_tokens = [
-        name for name, token in {
-            'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
-            'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
-            'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID,
-        }.items() if token is None
-    ]
+    missing_tokens = ', '.join(
+        name for name, token in (
+            ('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
+            ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
+            ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID),
+        ) if not token
+    )
 
     if missing_tokens:
-        logging.critical(
-            'Отсутствуют обязательные переменные окружения: '
-            f'{", ".join(missing_tokens)}'
+        logger.critical(
+            'Отсутствуют обязательные переменные окружения: %s',
+            missing_tokens
         )
         raise ValueError(
-            'Отсутствуют обязательные переменные окружения: '
-            f'{", ".join(missing_tokens)}'
+            f'Отсутствуют обязательные переменные окружения: {missing_tokens}'
         )
 
 
+def configure_telegram_session():
+    """Настраивает сессию и таймауты для запросов к API Telegram.
+
+    pyTelegramBotAPI и сам держит по одной keep-alive сессии на поток,
+    поэтому здесь лишь задаётся пул на одно соединение с единственным
+    хостом api.telegram.org и более короткий таймаут подключения.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    apihelper.session = session
+    apihelper.CONNECT_TIMEOUT = TELEGRAM_CONNECT_TIMEOUT
+    apihelper.READ_TIMEOUT = TELEGRAM_READ_TIMEOUT
+
+
+def deliver_message(bot, message):
+    """Отправляет сообщение в Telegram, не перехватывая ошибки API."""
+    logger.debug('Попытка отправить сообщение: "%s"', message)
+    bot.send_message(TELEGRAM_CHAT_ID, message)
+    logger.debug('Бот успешно отправил сообщение: "%s"', message)
+
+
 def send_message(bot, message):
-    """Отправляет сообщение в Telegram."""
-    logging.debug(f'Попытка отправить сообщение: "{message}"')
+    """Отправляет сообщение в Telegram и сообщает, удалось ли это."""
     try:
-        bot.send_message(TELEGRAM_CHAT_ID, message)
-        logging.debug(f'Бот успешно отправил сообщение: "{message}"')
-    except apihelper.ApiException as error:
-        logging.error(f'Сбой при отправке сообщения в Telegram: {error}')
+        deliver_message(bot, message)
+        return True
+    except (apihelper.ApiException, requests.RequestException) as error:
+        logger.error('Сбой при отправке сообщения в Telegram: %s', error)
+        return False
+
+
+def load_sent_statuses():
+    """Загружает с диска последний отправленный статус каждой работы."""
+    try:
+        with open(SENT_STATUSES_FILE, encoding='utf-8') as file:
+            sent_statuses = json.load(file)
+        if type(sent_statuses) is not dict:
+            raise ValueError('ожидался JSON-объект')
+        return sent_statuses
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as error:
+        logger.warning(
+            'Не удалось прочитать %s: %s', SENT_STATUSES_FILE, error
+        )
+        return {}
+
+
+def save_sent_statuses(sent_statuses):
+    """Атомарно сохраняет на диск отправленные статусы домашних работ."""
+    temp_file = f'{SENT_STATUSES_FILE}.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as file:
+        json.dump(sent_statuses, file)
+    os.replace(temp_file, SENT_STATUSES_FILE)
+
+
+def split_into_batches(statuses):
+    """Делит пары (ключ, сообщение) на пачки для одного сообщения Telegram."""
+    batches = []
+    batch_length = 0
+    for key, message in statuses:
+        length = len(message) + len(MESSAGE_SEPARATOR)
+        if batches and batch_length + length <= MESSAGE_BATCH_LIMIT:
+            batches[-1].append((key, message))
+            batch_length += length
+        else:
+            batches.append([(key, message)])
+            batch_length = len(message)
+    return batches
+
+
+def send_batch(bot, batch):
+    """Отправляет пачку одним сообщением и возвращает доставленные ключи."""
+    if len(batch) == 1:
+        key, message = batch[0]
+        return [key] if send_message(bot, message) else []
+    try:
+        deliver_message(
+            bot, MESSAGE_SEPARATOR.join(message for _, message in batch)
+        )
+    except (apihelper.ApiException, requests.RequestException) as error:
+        logger.error('Сбой при отправке пачки сообщений в Telegram: %s', error)
+        # При перегрузке, сбое Telegram или сети повторим всю пачку позже,
+        # а по одному отправляем, только если Telegram отверг само сообщение.
+        if getattr(error, 'error_code', None) != _HTTP_BAD_REQUEST:
+            return []
+        return [key for key, message in batch if send_message(bot, message)]
+    return [key for key, _ in batch]
+
+
+def send_new_statuses(bot, homeworks, sent_statuses):
+    """Отправляет сообщения только о ещё не отправленных статусах.
+
+    Для каждой работы хранится последний доставленный статус и время его
+    изменения, поэтому повторный переход в тот же статус тоже отправляется.
+    Возвращает True, если все новые статусы доставлены.
+    """
+    new_states = {}
+    new_statuses = []
+    for homework in homeworks:
+        key = str(homework['id'])
+        state = [homework['status'], homework.get('date_updated')]
+        if sent_statuses.get(key) != state:
+            new_states[key] = state
+            new_statuses.append((key, parse_status(homework)))
+    if not new_statuses:
+        logger.debug('Все статусы уже были отправлены')
+        return True
+    delivered = []
+    for batch in split_into_batches(new_statuses):
+        delivered.extend(send_batch(bot, batch))
+    if delivered:
+        sent_statuses.update((key, new_states[key]) for key in delivered)
+        save_sent_statuses(sent_statuses)
+    return len(delivered) == len(new_statuses)
 
 
 def handle_api_error(response):
     """Проверяет статус ответа API и выбрасывает исключение в случае ошибки."""
-    if response.status_code != http.HTTPStatus.OK:
+    if response.status_code not in _ACCEPTED_STATUSES:
         raise requests.HTTPError(
             f'API вернул неожиданный статус: {response.status_code}'
         )
 
 
+def log_compression(response):
+    """Один раз за запуск логирует, насколько API сжал ответ."""
+    global _compression_logged
+    if _compression_logged or not logger.isEnabledFor(logging.DEBUG):
+        return
+    _compression_logged = True
+    encoding = response.headers.get('Content-Encoding')
+    if not encoding or encoding == 'identity':
+        logger.debug('API вернул ответ без сжатия')
+        return
+    # Сколько байт пришло по сети; при chunked-передаче размер неизвестен.
+    raw = getattr(response, 'raw', None)
+    compressed_size = raw.tell() if raw is not None else 0
+    content_length = response.headers.get('Content-Length', '')
+    if not compressed_size and content_length.isdigit():
+        compressed_size = int(content_length)
+    if not compressed_size:
+        logger.debug(
+            'API сжал ответ (%s), размер до распаковки неизвестен', encoding
+        )
+        return
+    logger.debug(
+        'API сжал ответ (%s): %s байт вместо %s, коэффициент %.1f',
+        encoding, compressed_size, len(response.content),
+        len(response.content) / compressed_size
+    )
+
+
+def homeworks_digest(answer):
+    """Возвращает хеш списка работ из ответа API или None.
+
+    current_date в каждом ответе свой, поэтому тело целиком между
+    запросами не повторяется: сравнивать можно только список работ.
+    """
+    if type(answer) is not dict or type(answer.get('homeworks')) is not list:
+        return None
+    return hashlib.blake2b(
+        json.dumps(answer['homeworks'], sort_keys=True).encode(),
+        digest_size=16
+    ).digest()
+
+
 def get_api_answer(timestamp):
-    """Делает запрос к API и возвращает ответ."""
+    """Делает запрос к API и возвращает ответ.
+
+    Если ответ не изменился с прошлого запроса, возвращает UNCHANGED.
+    """
     params = {'from_date': timestamp}
-    logging.debug(f'Попытка сделать запрос к API с параметрами: {params}')
+    for header, key in _CONDITIONAL_HEADERS:
+        if _response_cache.get(key):
+            _PREPARED.headers[header] = _response_cache[key]
+        else:
+            _PREPARED.headers.pop(header, None)
+    logger.debug('Попытка сделать запрос к API с параметрами: %s', params)
     try:
-        response = requests.get(
-            ENDPOINT,
-            headers=HEADERS,
-            params=params
+        _PREPARED.prepare_url(ENDPOINT, params)
+        response = SESSION.send(
+            _PREPARED,
+            timeout=REQUEST_TIMEOUT,
+            allow_redirects=False,
+            **_SEND_SETTINGS
         )
         handle_api_error(response)
-        logging.debug(
-            'Успешный запрос к API.'
-            f' Статус код: {response.status_code}'
+        logger.debug(
+            'Успешный запрос к API. Статус код: %s', response.status_code
         )
-        return response.json()
+        if response.status_code == _HTTP_NOT_MODIFIED:
+            return UNCHANGED
+        log_compression(response)
+        answer = json_loads(response.content)
+        digest = homeworks_digest(answer)
+        if digest is not None and digest == _response_cache.get('digest'):
+            return UNCHANGED
+        _response_cache.update(
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            digest=digest,
+        )
+        return answer
     except requests.RequestException as err:
         raise AssertionError(
             f'Ошибка запроса к API: {err}. Параметры: {params}, заголовки: '
@@ -87,61 +309,96 @@ def get_api_answer(timestamp):
 
 
 def check_response(response):
-    """Проверяет ответ API на наличие необходимых ключей."""
-    if not isinstance(response, dict):
+    """Проверяет ответ API на наличие необходимых ключей.
+
+    Ожидает ровно dict и list, как их возвращает JSON-декодер:
+    подклассы не поддерживаются.
+    """
+    if type(response) is not dict:
         raise TypeError('Ответ API должен быть словарем')
 
-    if 'homeworks' not in response:
-        raise KeyError('Отсутствуют ключи в ответе API')
+    homeworks = response.get('homeworks')
 
-    homeworks = response['homeworks']
+    if homeworks is None:
+        raise KeyError('Отсутствуют ключи в ответе API')
 
-    if not isinstance(homeworks, list):
+    if type(homeworks) is not list:
         raise TypeError('Данные под ключом "homeworks" должны быть списком')
 
+    if 'current_date' not in response:
+        logger.warning(
+            'В ответе API нет ключа "current_date", '
+            'метка времени следующего запроса не изменится'
+        )
+
     return homeworks
 
 
 def parse_status(homework):
     """Извлекает статус домашней работы и возвращает сообщение."""
-    homework_name = homework.get('homework_name')
-    homework_status = homework.get('status')
-
-    if homework_name is None:
-        raise KeyError('Отсутствует ключ "homework_name" в домашней работе')
-
-    verdict = HOMEWORK_VERDICTS.get(homework_status)
-
-    if verdict is None:
-        raise ValueError(f'Неожиданный статус: {homework_status}')
-
-    return (
-        f'Изменился статус проверки работы "{homework_name}". {verdict}'
-    )
+    try:
+        return _format_message(
+            homework['homework_name'], _get_verdict(homework['status'])
+        )
+    except KeyError as error:
+        if 'homework_name' in homework and 'status' in homework:
+            raise ValueError(
+                f'Неожиданный статус: {homework["status"]}'
+            ) from error
+        raise KeyError(
+            f'Отсутствует ключ {error} в домашней работе'
+        ) from error
 
 
 def main():
     """Основная логика работы бота."""
     check_tokens()
     bot = TeleBot(TELEGRAM_TOKEN)
+    configure_telegram_session()
     timestamp = int(time.time())
+    retry_period = RETRY_PERIOD
+    error_period = ERROR_RETRY_PERIOD
+    last_error_message = None
+    sent_statuses = load_sent_statuses()
 
     while True:
         try:
             response = get_api_answer(timestamp)
-            homeworks = check_response(response)
+            if response is UNCHANGED:
+                logger.debug('Ответ API не изменился с прошлого запроса')
+                homeworks, current_date = [], timestamp
+            else:
+                homeworks = check_response(response)
+                current_date = response.get('current_date', timestamp)
 
             if homeworks:
-                for homework in homeworks:
-                    message = parse_status(homework)
-                    send_message(bot, message)
+                retry_period = RETRY_PERIOD
+                if not send_new_statuses(bot, homeworks, sent_statuses):
+                    # Недоставленные статусы запросим и отправим заново.
+                    _response_cache.clear()
+                    current_date = timestamp
             else:
-                logging.debug('Нет новых статусов')
+                logger.debug('Нет новых статусов')
+                # Пока статусы не меняются, опрашиваем API всё реже.
+                retry_period = min(retry_period * 2, MAX_RETRY_PERIOD)
+
+            # Следующий запрос вернёт только изменения после этого ответа.
+            timestamp = current_date
+            error_period = ERROR_RETRY_PERIOD
+            last_error_message = None
 
         except Exception as error:
-            logging.error(f'Сбой в работе программы: {error}')
-            send_message(bot, f'Сбой в работе программы: {error}')
-        time.sleep(RETRY_PERIOD)
+            # Ответ, на котором произошёл сбой, нужно обработать заново.
+            _response_cache.clear()
+            message = f'Сбой в работе программы: {error}'
+            logger.error(message)
+            # Одну и ту же ошибку не отправляем повторно, пока она не пройдёт.
+            if message != last_error_message and send_message(bot, message):
+                last_error_message = message
+            time.sleep(error_period * random.uniform(0.8, 1.2))
+            error_period = min(error_period * 2, MAX_ERROR_RETRY_PERIOD)
+            continue
+        time.sleep(retry_period)
 
 
 if __name__ == '__main__':
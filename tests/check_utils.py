@@ -1,3 +1,4 @@
+import json
 import logging
 import signal
 import re
@@ -7,6 +8,7 @@ from functools import wraps
 from http import HTTPStatus
 from inspect import signature
 from types import ModuleType
+from urllib.parse import parse_qsl, urlsplit
 
 
 def get_clean_source_code(raw_src: str) -> str:
@@ -77,6 +79,11 @@ def check_logging(caplog, level, message):
         assert len(log_record) > 0, message
 
 
+def get_query_params(request) -> dict:
+    """Return query params of a prepared request as a dict."""
+    return dict(parse_qsl(urlsplit(request.url).query))
+
+
 InvalidResponse = namedtuple('InvalidResponse', ('data', 'defected_key'))
 
 
@@ -96,6 +103,8 @@ class MockResponseGET:
             'current_date': self.random_timestamp
         }
         self.data = data if data is not None else default_data
+        self.headers = {}
+        self.content = json.dumps(self.data).encode()
         logging.warn(MockResponseGET.CALLED_LOG_MSG)
 
     def json(self):
@@ -18,8 +18,12 @@ def current_timestamp():
 
 
 @pytest.fixture
-def homework_module():
+def homework_module(monkeypatch, tmp_path):
     import homework
+    homework._response_cache.clear()
+    monkeypatch.setattr(
+        homework, 'SENT_STATUSES_FILE', str(tmp_path / 'sent_statuses.json')
+    )
     return homework
 
 
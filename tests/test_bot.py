@@ -2,8 +2,10 @@ import inspect
 import logging
 import platform
 import re
+import threading
 import time
 from http import HTTPStatus
+from types import SimpleNamespace
 
 import pytest
 import requests
@@ -36,6 +38,21 @@ def get_mock_telegram_bot(monkeypatch, random_message):
     return telebot.TeleBot(token='')
 
 
+class RecordingTelegramBot:
+    def __init__(self, reject=lambda text: False, error_code=400):
+        self.texts = []
+        self.reject = reject
+        self.error_code = error_code
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        self.texts.append(text)
+        if self.reject(text):
+            raise telebot.apihelper.ApiTelegramException(
+                'send_message', None,
+                {'error_code': self.error_code, 'description': 'rejected'}
+            )
+
+
 class TestHomework:
     HOMEWORK_VERDICTS = {
         'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
@@ -55,6 +72,7 @@ class TestHomework:
         'main': 0
     }
     RETRY_PERIOD = 600
+    MAX_RETRY_PERIOD = 3600
     INVALID_RESPONSES = {
         'no_homework_key': check_utils.InvalidResponse(
             {
@@ -167,34 +185,32 @@ class TestHomework:
         )
 
         def check_request_call(
-                url, current_timestamp=current_timestamp, **kwargs
+                request, current_timestamp=current_timestamp, **kwargs
         ):
             expected_url = (
                 'https://practicum.yandex.ru/api/user_api/homework_statuses'
             )
-            assert url.startswith(expected_url), (
+            assert request.url.startswith(expected_url), (
                 'Проверьте адрес, на который отправляются запросы.'
             )
-            assert 'headers' in kwargs, (
-                'Проверьте, что в запрос к API передан заголовок.'
-            )
-            assert 'Authorization' in kwargs['headers'], (
+            assert 'Authorization' in request.headers, (
                 'Проверьте, что в заголовках запроса передано поле '
                 '`Authorization`.'
             )
-            assert kwargs['headers']['Authorization'].startswith('OAuth '), (
+            assert request.headers['Authorization'].startswith('OAuth '), (
                 'Проверьте, что заголовок `Authorization` '
                 'начинается с `OAuth`.'
             )
-            assert 'params' in kwargs, (
-                'Проверьте, что в запросе переданы параметры `params`.'
+            assert kwargs.get('timeout'), (
+                'Проверьте, что для запроса к API задан `timeout`.'
             )
-            assert 'from_date' in kwargs['params'], (
+            params = check_utils.get_query_params(request)
+            assert 'from_date' in params, (
                 'Проверьте, что в параметрах к запросу передан параметр '
                 '`from_date`.'
             )
             try:
-                from_date = int(kwargs['params']['from_date'])
+                from_date = int(params['from_date'])
                 assert from_date == int(current_timestamp), (
                     'Проверьте, что в параметре `from_date` передан timestamp.'
                 )
@@ -203,7 +219,9 @@ class TestHomework:
                     'Проверьте, что в параметре `from_date` передано число.'
                 )
 
-        monkeypatch.setattr(requests, 'get', check_request_call)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'send', check_request_call
+        )
         try:
             homework_module.get_api_answer(current_timestamp)
         except AssertionError:
@@ -228,13 +246,82 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(homework_module.SESSION, 'send', mock_response_get)
 
         result = homework_module.get_api_answer(current_timestamp)
         assert isinstance(result, dict), (
             f'Проверьте, что функция `{func_name}` возвращает словарь.'
         )
 
+    def test_get_api_answer_unchanged(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            homework_module
+    ):
+        sent_headers = []
+
+        def mock_response_get(*args, **kwargs):
+            sent_headers.append(dict(args[0].headers))
+            response = check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            response.headers = {'ETag': '"abc"'}
+            return response
+
+        monkeypatch.setattr(homework_module.SESSION, 'send', mock_response_get)
+        first = homework_module.get_api_answer(current_timestamp)
+        second = homework_module.get_api_answer(current_timestamp)
+        assert isinstance(first, dict)
+        assert second is homework_module.UNCHANGED, (
+            'Убедитесь, что при повторном получении того же ответа API '
+            'функция `get_api_answer` возвращает `UNCHANGED`.'
+        )
+        assert sent_headers[1].get('If-None-Match') == '"abc"', (
+            'Убедитесь, что в повторный запрос передаётся ETag '
+            'предыдущего ответа.'
+        )
+
+        not_modified = create_mock_response_get_with_custom_status_and_data(
+            random_timestamp=random_timestamp,
+            http_status=HTTPStatus.NOT_MODIFIED,
+            data={}
+        )
+        monkeypatch.setattr(homework_module.SESSION, 'send', not_modified)
+        result = homework_module.get_api_answer(current_timestamp)
+        assert result is homework_module.UNCHANGED, (
+            'Убедитесь, что на ответ `304 Not Modified` функция '
+            '`get_api_answer` возвращает `UNCHANGED`.'
+        )
+
+    @pytest.mark.parametrize('headers, raw_size, expected', (
+        (
+            {'Content-Encoding': 'gzip', 'Content-Length': '100'}, 100,
+            'API сжал ответ (gzip): 100 байт вместо 450, коэффициент 4.5'
+        ),
+        (
+            {'Content-Encoding': 'gzip', 'Transfer-Encoding': 'chunked'}, 0,
+            'API сжал ответ (gzip), размер до распаковки неизвестен'
+        ),
+        ({'Content-Length': '450'}, 450, 'API вернул ответ без сжатия'),
+    ))
+    def test_log_compression(
+            self, monkeypatch, caplog, homework_module, headers, raw_size,
+            expected
+    ):
+        monkeypatch.setattr(homework_module, '_compression_logged', False)
+        response = SimpleNamespace(
+            headers=requests.structures.CaseInsensitiveDict(headers),
+            content=b'x' * 450,
+            raw=SimpleNamespace(tell=lambda: raw_size),
+        )
+        with caplog.at_level(logging.DEBUG):
+            homework_module.log_compression(response)
+            homework_module.log_compression(response)
+        messages = [record.message for record in caplog.records]
+        assert messages == [expected], (
+            'Убедитесь, что сжатие ответа определяется по '
+            '`Content-Encoding` и логируется один раз.'
+        )
+
     @pytest.mark.parametrize('response', NOT_OK_RESPONSES.values())
     def test_get_not_200_status_response(
             self, monkeypatch, current_timestamp, response, homework_module
@@ -246,7 +333,7 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name]
         )
 
-        monkeypatch.setattr(requests, 'get', response)
+        monkeypatch.setattr(homework_module.SESSION, 'send', response)
         try:
             homework_module.get_api_answer(current_timestamp)
         except Exception:
@@ -270,7 +357,9 @@ class TestHomework:
         def mock_request_get_with_exception(*args, **kwargs):
             raise requests.RequestException('Something wrong')
 
-        monkeypatch.setattr(requests, 'get', mock_request_get_with_exception)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'send', mock_request_get_with_exception
+        )
         try:
             homework_module.get_api_answer(current_timestamp)
         except requests.RequestException as e:
@@ -357,6 +446,16 @@ class TestHomework:
                     'статус домашней работы либо домашку без статуса.'
                 )
 
+    def test_parse_status_unknown_status_message(self, homework_module):
+        with pytest.raises(ValueError) as error:
+            homework_module.parse_status(
+                {'homework_name': 'hw123', 'status': 'unknown'}
+            )
+        assert str(error.value) == 'Неожиданный статус: unknown', (
+            'Убедитесь, что для недокументированного статуса функция '
+            '`parse_status` выбрасывает `ValueError` с понятным текстом.'
+        )
+
     def test_parse_status_no_homework_name_key(self, homework_module):
         homework_with_invalid_name = {
             'status': 'approved'
@@ -495,6 +594,203 @@ class TestHomework:
                 'метод бота `send_message`.'
             )
 
+    def test_send_new_statuses_skips_sent(
+            self, monkeypatch, homework_module, data_with_new_hw_status
+    ):
+        sent = []
+
+        def mock_send_message(bot, message):
+            sent.append(message)
+            return True
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        homeworks = data_with_new_hw_status['homeworks']
+        homework_module.send_new_statuses(
+            None, homeworks, homework_module.load_sent_statuses()
+        )
+        homework_module.send_new_statuses(
+            None, homeworks, homework_module.load_sent_statuses()
+        )
+        assert len(sent) == 1, (
+            'Убедитесь, что сообщение об одном и том же статусе домашней '
+            'работы не отправляется повторно, в том числе после перезапуска.'
+        )
+
+    def test_main_sends_repeated_status_transitions(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        statuses = ['reviewing', 'rejected', 'reviewing', 'rejected']
+        polls = []
+        sent = []
+
+        def mock_response_get(*args, **kwargs):
+            number = len(polls)
+            polls.append(number)
+            data = {
+                'homeworks': [{
+                    'id': 1,
+                    'homework_name': 'hw1',
+                    'status': statuses[number],
+                    'date_updated': f'2024-01-0{number + 1}T10:00:00Z',
+                }],
+                'current_date': random_timestamp + number,
+            }
+            return check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, data=data, **kwargs
+            )
+
+        def mock_send_message(bot, message):
+            sent.append(message)
+            return True
+
+        def sleep_to_interrupt(secs):
+            if len(polls) == len(statuses):
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module.SESSION, 'send', mock_response_get
+        )
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert len(sent) == len(statuses), (
+            'Убедитесь, что повторный переход домашней работы в тот же '
+            'статус тоже отправляется в Telegram.'
+        )
+        assert list(homework_module.load_sent_statuses()) == ['1'], (
+            'Убедитесь, что для каждой работы хранится только последний '
+            'отправленный статус.'
+        )
+
+    def test_main_retries_undelivered_status(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module, data_with_new_hw_status
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module,
+            response_data=data_with_new_hw_status
+        )
+        from_dates = []
+        sent = []
+
+        def mock_response_get(*args, **kwargs):
+            params = check_utils.get_query_params(args[0])
+            from_dates.append(int(params['from_date']))
+            return check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                data=data_with_new_hw_status, **kwargs
+            )
+
+        def mock_send_message(bot, message):
+            sent.append(message)
+            # Первая попытка отправки не удаётся.
+            return len(sent) > 1
+
+        def sleep_to_interrupt(secs):
+            if len(from_dates) == 3:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module.SESSION, 'send', mock_response_get
+        )
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert from_dates[1] == from_dates[0], (
+            'Убедитесь, что после недоставленного сообщения `from_date` '
+            'не сдвигается.'
+        )
+        assert len(sent) == 2, (
+            'Убедитесь, что недоставленный статус отправляется повторно '
+            'при следующем запросе, но только один раз после успеха.'
+        )
+        assert from_dates[2] == random_timestamp, (
+            'Убедитесь, что после доставки статуса `from_date` сдвигается '
+            'на `current_date` ответа.'
+        )
+
+    def test_split_into_batches(self, homework_module):
+        statuses = [(number, 'x' * 1500) for number in range(5)]
+        batches = homework_module.split_into_batches(statuses)
+        assert [len(batch) for batch in batches] == [2, 2, 1], (
+            'Убедитесь, что сообщения группируются в пачки, не превышающие '
+            '`MESSAGE_BATCH_LIMIT` символов.'
+        )
+
+    def test_send_new_statuses_in_one_message(self, homework_module):
+        bot = RecordingTelegramBot()
+        homeworks = [
+            {'id': number, 'homework_name': f'hw{number}', 'status': status}
+            for number, status in enumerate(self.HOMEWORK_VERDICTS)
+        ]
+        homework_module.send_new_statuses(bot, homeworks, {})
+        assert len(bot.texts) == 1, (
+            'Убедитесь, что статусы нескольких домашних работ отправляются '
+            'в Telegram одним сообщением.'
+        )
+        for verdict in self.HOMEWORK_VERDICTS.values():
+            assert verdict in bot.texts[0]
+
+    def test_send_batch_falls_back_to_single_messages(self, homework_module):
+        bot = RecordingTelegramBot(
+            reject=lambda text: text == 'bad' or '\n\n' in text
+        )
+        batch = [(1, 'good'), (2, 'bad'), (3, 'also good')]
+        delivered = homework_module.send_batch(bot, batch)
+        assert delivered == [1, 3], (
+            'Убедитесь, что при отказе Telegram принять пачку из-за '
+            'ошибки в сообщении сообщения отправляются по одному.'
+        )
+        assert bot.texts[1:] == ['good', 'bad', 'also good'], (
+            'Убедитесь, что сообщения пачки отправляются по одному '
+            'в исходном порядке.'
+        )
+
+    def test_send_batch_does_not_split_on_telegram_failure(
+            self, homework_module
+    ):
+        bot = RecordingTelegramBot(reject=lambda text: True, error_code=429)
+        batch = [(1, 'good'), (2, 'also good')]
+        delivered = homework_module.send_batch(bot, batch)
+        assert delivered == [] and len(bot.texts) == 1, (
+            'Убедитесь, что при перегрузке или сбое Telegram пачка не '
+            'рассылается по одному сообщению.'
+        )
+
+    def test_send_batch_does_not_split_on_network_error(
+            self, homework_module
+    ):
+        class OfflineTelegramBot(RecordingTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                self.texts.append(text)
+                raise requests.ConnectionError('telegram down')
+
+        bot = OfflineTelegramBot()
+        batch = [(1, 'good'), (2, 'also good')]
+        delivered = homework_module.send_batch(bot, batch)
+        assert delivered == [] and len(bot.texts) == 1, (
+            'Убедитесь, что при сетевой ошибке пачка не рассылается '
+            'по одному сообщению и повторяется целиком.'
+        )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = 'main'
         check_utils.check_function(
@@ -559,9 +855,10 @@ class TestHomework:
             if caller != 'main':
                 old_sleep(secs)
                 return
-            assert secs == 600, (
+            assert self.RETRY_PERIOD <= secs <= self.MAX_RETRY_PERIOD, (
                 'Убедитесь, что повторный запрос к API домашки отправляется '
-                'через 10 минут: `time.sleep(RETRY_PERIOD)`.'
+                'не раньше чем через `RETRY_PERIOD` и не позже чем через '
+                '`MAX_RETRY_PERIOD`.'
             )
             raise check_utils.BreakInfiniteLoop('break')
 
@@ -595,8 +892,8 @@ class TestHomework:
                 data=response_data
             ))
         monkeypatch.setattr(
-            requests,
-            'get',
+            homework_module.SESSION,
+            'send',
             mock_response_get_with_new_status
         )
         if platform.system() != 'Windows':
@@ -604,6 +901,54 @@ class TestHomework:
                 check_utils.with_timeout(homework_module.main)
             )
 
+    def test_main_configures_telegram_session(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        apihelper = telebot.apihelper
+        for name in ('session', 'CONNECT_TIMEOUT', 'READ_TIMEOUT'):
+            monkeypatch.setattr(apihelper, name, getattr(apihelper, name))
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert isinstance(apihelper.session, requests.Session), (
+            'Убедитесь, что `main()` задаёт общую сессию '
+            '`apihelper.session` для запросов к Telegram.'
+        )
+        adapter = apihelper.session.get_adapter('https://api.telegram.org')
+        sent = []
+
+        def mock_adapter_send(request, **kwargs):
+            sent.append(kwargs['timeout'])
+            response = requests.Response()
+            response.status_code = HTTPStatus.OK
+            response._content = b'{"ok": true, "result": {}}'
+            return response
+
+        monkeypatch.setattr(adapter, 'send', mock_adapter_send)
+        # В новом потоке pyTelegramBotAPI берёт сессию заново,
+        # а не из кеша потока, оставшегося от других тестов.
+        thread = threading.Thread(
+            target=apihelper._make_request, args=('123:token', 'getMe')
+        )
+        thread.start()
+        thread.join()
+        assert sent == [(
+            homework_module.TELEGRAM_CONNECT_TIMEOUT,
+            homework_module.TELEGRAM_READ_TIMEOUT
+        )], (
+            'Убедитесь, что запросы к Telegram идут через настроенную '
+            'сессию с заданными таймаутами.'
+        )
+
     def test_main_without_env_vars_raise_exception(
             self, caplog, monkeypatch, random_timestamp, current_timestamp,
             random_message, homework_module
@@ -658,7 +1003,7 @@ class TestHomework:
                     )
                 ]
                 assert log_record, (
-                    'Убедитесь, что бот использует функцию `requests.get()` '
+                    'Убедитесь, что бот использует метод `SESSION.send()` '
                     'для отправки запроса к API домашки.'
                 )
 
@@ -780,6 +1125,214 @@ class TestHomework:
                     f'Вызов функции `main` завершился ошибкой: {e}'
                 ) from e
 
+    def test_main_advances_timestamp(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        from_dates = []
+
+        def mock_response_get(*args, **kwargs):
+            params = check_utils.get_query_params(args[0])
+            from_dates.append(int(params['from_date']))
+            return check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+
+        def sleep_to_interrupt(secs):
+            if len(from_dates) == 2:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module.SESSION, 'send', mock_response_get
+        )
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert from_dates[1] == random_timestamp, (
+            'Убедитесь, что следующий запрос к API домашки отправляется '
+            'с `from_date`, равным `current_date` из предыдущего ответа.'
+        )
+
+    def test_main_skips_unchanged_response(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module, data_with_new_hw_status
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module,
+            response_data=data_with_new_hw_status
+        )
+        calls = []
+        check_response = homework_module.check_response
+
+        def mock_check_response(response):
+            calls.append(response)
+            return check_response(response)
+
+        periods = []
+
+        def sleep_to_interrupt(secs):
+            periods.append(secs)
+            if len(periods) == 3:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        def mock_response_get(*args, **kwargs):
+            # Как и настоящий API, каждый ответ несёт свой current_date.
+            data = dict(data_with_new_hw_status)
+            data['current_date'] = current_timestamp + len(periods)
+            return check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, data=data, **kwargs
+            )
+
+        monkeypatch.setattr(homework_module.SESSION, 'send', mock_response_get)
+        monkeypatch.setattr(
+            homework_module, 'check_response', mock_check_response
+        )
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert len(calls) == 1, (
+            'Убедитесь, что повторный такой же ответ API не обрабатывается '
+            'заново.'
+        )
+
+    def test_main_retry_period_grows_without_new_statuses(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        periods = []
+
+        def sleep_to_interrupt(secs):
+            periods.append(secs)
+            if len(periods) == 4:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert periods == [1200, 2400, 3600, 3600], (
+            'Убедитесь, что при отсутствии новых статусов интервал опроса '
+            'API удваивается, но не превышает `MAX_RETRY_PERIOD`.'
+        )
+
+    def test_main_backs_off_on_errors(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        periods = []
+        messages = []
+
+        def mock_request_get_with_exception(*args, **kwargs):
+            raise requests.RequestException('Something wrong')
+
+        def sleep_to_interrupt(secs):
+            periods.append(secs)
+            if len(periods) == 8:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        def mock_send_message(bot, message=''):
+            messages.append(message)
+            return True
+
+        monkeypatch.setattr(
+            homework_module.SESSION, 'send', mock_request_get_with_exception
+        )
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        expected = [30, 60, 120, 240, 480, 960, 1800, 1800]
+        for secs, base in zip(periods, expected):
+            assert base * 0.8 <= secs <= base * 1.2, (
+                'Убедитесь, что после ошибки интервал повторного запроса '
+                'растёт экспоненциально и не превышает '
+                '`MAX_ERROR_RETRY_PERIOD`.'
+            )
+        assert len(messages) == 1, (
+            'Убедитесь, что одна и та же ошибка отправляется в Telegram '
+            'только один раз.'
+        )
+
+    def test_main_survives_telegram_network_errors(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        attempts = []
+        periods = []
+
+        class MockedBotWithNetworkError(check_utils.MockTelegramBot):
+            def send_message(self, *args, **kwargs):
+                attempts.append(args)
+                raise requests.ConnectionError('telegram down')
+
+        def mock_request_get_with_exception(*args, **kwargs):
+            raise requests.ConnectionError('practicum down')
+
+        def sleep_to_interrupt(secs):
+            periods.append(secs)
+            if len(periods) == 2:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module, 'TeleBot', MockedBotWithNetworkError
+        )
+        monkeypatch.setattr(
+            homework_module.SESSION, 'send', mock_request_get_with_exception
+        )
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        except requests.RequestException as e:
+            raise AssertionError(
+                'Убедитесь, что бот не останавливает работу при сетевой '
+                'ошибке отправки сообщения в Telegram.'
+            ) from e
+        assert len(attempts) == 2, (
+            'Убедитесь, что недоставленное сообщение об ошибке '
+            'отправляется повторно.'
+        )
+
     def test_main_send_message_with_telegram_exception(
             self, monkeypatch, random_timestamp, current_timestamp,
             random_message, caplog, homework_module, data_with_new_hw_status